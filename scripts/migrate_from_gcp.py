@@ -26,10 +26,15 @@ Required environment variables:
 """
 
 import argparse
+import concurrent.futures
+import functools
 import os
+import queue
 import sys
+import threading
+import time
 import logging
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 
 # Set up logging
 logging.basicConfig(
@@ -46,6 +51,34 @@ TABLES_TO_MIGRATE = [
     "interactions",     # References people(id)
 ]
 
+# Tables that must finish migrating before a given table can start
+TABLE_DEPENDENCIES = {
+    "interactions": {"people"},
+}
+
+# Number of fetched batches the source reader may run ahead of the destination writer
+READ_AHEAD_BATCHES = 4
+
+# Parallel source readers used for large tables with an integer id
+SOURCE_READERS = 4
+
+# Settings applied to each destination load transaction. The migration can simply be
+# re-run, so commits don't need to wait for WAL to be durable.
+LOAD_SETTINGS = {
+    "synchronous_commit": "off",
+    "maintenance_work_mem": "512MB",  # index rebuilds after the load
+    "work_mem": "128MB",
+}
+
+# Minimum seconds between per-table progress log lines
+PROGRESS_LOG_INTERVAL = 2.0
+
+# Foreign server and schema used by --method fdw to reach the source from Neon
+FDW_SERVER = "gcp_source"
+FDW_SCHEMA = "gcp_source"
+# Comment marking the server and schema as created by this script, so only those are dropped
+FDW_COMMENT = "Created by migrate_from_gcp.py"
+
 
 def get_gcp_engine():
     """Create a SQLAlchemy engine connected to GCP Cloud SQL via the Cloud SQL Connector."""
@@ -91,11 +124,11 @@ def get_neon_engine():
     if not neon_url:
         raise RuntimeError("NEON_DATABASE_URL environment variable is required")
 
-    # Normalize connection string for psycopg2
+    # Normalize connection string for psycopg (v3)
     if neon_url.startswith("postgres://"):
-        neon_url = neon_url.replace("postgres://", "postgresql+psycopg2://", 1)
+        neon_url = neon_url.replace("postgres://", "postgresql+psycopg://", 1)
     elif neon_url.startswith("postgresql://"):
-        neon_url = neon_url.replace("postgresql://", "postgresql+psycopg2://", 1)
+        neon_url = neon_url.replace("postgresql://", "postgresql+psycopg://", 1)
 
     logger.info("Connecting to Neon database")
     engine = create_engine(neon_url)
@@ -104,8 +137,6 @@ def get_neon_engine():
 
 def ensure_schema_exists(engine, tables: list[str]):
     """Ensure the required tables exist in the destination database."""
-    from sqlalchemy import text
-
     schema_sql = """
     CREATE TABLE IF NOT EXISTS people (
         id SERIAL PRIMARY KEY,
@@ -153,8 +184,9 @@ def ensure_schema_exists(engine, tables: list[str]):
     );
     """
 
+    # Without parameters psycopg sends the whole script as one simple-protocol query
     with engine.begin() as conn:
-        conn.execute(text(schema_sql))
+        conn.execution_options(no_parameters=True).exec_driver_sql(schema_sql)
     logger.info("Schema ensured in destination database")
 
 
@@ -167,78 +199,614 @@ def get_table_count(engine, table: str) -> int:
         return result.scalar()
 
 
-def get_table_columns(engine, table: str) -> list[str]:
-    """Get column names for a table."""
+def get_estimated_count(engine, table: str) -> int | None:
+    """Get a table's row estimate from pg_class (None or 0 if never analyzed)."""
+    # reltuples is only refreshed by VACUUM/ANALYZE; PostgreSQL 14+ reports -1 for a
+    # never-analyzed table, older versions 0
     from sqlalchemy import text
 
     with engine.connect() as conn:
         result = conn.execute(
-            text(
-                """
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = :table
-            ORDER BY ordinal_position
-            """
-            ),
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
             {"table": table},
         )
-        return [row[0] for row in result]
+        estimate = result.scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
 
 
-def migrate_table(source_engine, dest_engine, table: str, batch_size: int = 1000):
-    """Migrate a single table from source to destination."""
+@functools.lru_cache(maxsize=32)
+def get_table_columns(engine, table: str) -> tuple[str, ...]:
+    """Get column names for a table."""
     from sqlalchemy import text
 
-    source_count = get_table_count(source_engine, table)
-    logger.info(f"Migrating {table}: {source_count} rows in source")
+    # Read the description of an empty result; information_schema is slow on Cloud SQL
+
+    with engine.connect() as conn:
+        result = conn.execute(text(f"SELECT * FROM {table} WHERE false"))
+        return tuple(result.keys())
+
+
+class _CopyPipe:
+    """Bounded in-memory pipe between a COPY TO STDOUT writer and a COPY FROM STDIN reader."""
 
-    if source_count == 0:
-        logger.info(f"  Skipping {table}: no rows to migrate")
-        return
+    def __init__(self, maxsize: int = 16, chunk_size: int = 64 * 1024):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._pending = b""
+        self._eof = False
+        self._aborted = threading.Event()
+
+    def _put(self, item):
+        while not self._aborted.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise RuntimeError("COPY pipe reader aborted")
+
+    def write(self, data) -> int:
+        # pg8000 writes one CopyData message (a single row) per call, so rows are
+        # collected into larger chunks before being handed to the reader
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+
+    def close(self, error: Exception | None = None):
+        """Signal EOF to the reader, or propagate a writer-side error."""
+        try:
+            if error is None and self._buffer:
+                self._put(bytes(self._buffer))
+            self._put(error)
+        except RuntimeError:
+            pass
+
+    def abort(self):
+        """Stop the writer side after a reader-side failure."""
+        self._aborted.set()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending and not self._eof:
+            chunk = self._queue.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if chunk is None:
+                self._eof = True
+            else:
+                self._pending = chunk
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def _fetch_forward(cur, batch_size: int) -> list:
+    """Fetch the next batch of rows from the ``migrate_rows`` server-side cursor."""
+    cur.execute(f"FETCH FORWARD {batch_size} FROM migrate_rows")
+    return cur.fetchall()
+
+
+def _read_ahead(
+    source_engine,
+    selects: list[tuple[str, tuple]],
+    batch_size: int,
+    max_batches: int = READ_AHEAD_BATCHES,
+):
+    """Yield row batches read from the source by one background thread per select."""
+    # Readers share a bounded queue, so source reads overlap destination writes while
+    # memory stays bounded; closing the generator stops them early
+    batches = queue.Queue(maxsize=max_batches)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(select_sql: str, params: tuple):
+        try:
+            # Raw DBAPI server-side cursor, bypassing SQLAlchemy's result layer
+            src = source_engine.raw_connection()
+            try:
+                cur = src.cursor()
+                cur.execute(f"DECLARE migrate_rows NO SCROLL CURSOR FOR {select_sql}", params)
+                while batch := _fetch_forward(cur, batch_size):
+                    if not put(batch):
+                        return
+                cur.close()
+            finally:
+                src.rollback()
+                src.close()
+            put(None)
+        except Exception as e:
+            put(e)
+
+    readers = [
+        threading.Thread(target=produce, args=select, name=f"read-ahead-{i}", daemon=True)
+        for i, select in enumerate(selects)
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        remaining = len(readers)
+        while remaining:
+            item = batches.get()
+            if item is None:
+                remaining -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+
+def _source_selects(
+    source_engine, table: str, columns: tuple[str, ...], batch_size: int
+) -> list[tuple[str, tuple]]:
+    """Build the SELECTs used to read a table, split into id ranges for large tables."""
+    from sqlalchemy import text
+
+    select_sql = f"SELECT {', '.join(columns)} FROM {table}"
+    if "id" not in columns:
+        return [(select_sql, ())]
+
+    # MIN/MAX on the primary key are index lookups, unlike COUNT(*)
+    with source_engine.connect() as conn:
+        low, high = conn.execute(text(f"SELECT MIN(id), MAX(id) FROM {table}")).one()
+    if low is None or high - low < batch_size * SOURCE_READERS:
+        return [(select_sql, ())]
+
+    # The outer ranges are open-ended, so rows inserted after MIN/MAX are still read
+    step = (high - low) // SOURCE_READERS + 1
+    cuts = list(range(low + step, high + 1, step))
+    selects = [(f"{select_sql} WHERE id < %s ORDER BY id", (cuts[0],))]
+    selects += [
+        (f"{select_sql} WHERE id >= %s AND id < %s ORDER BY id", (lo, hi))
+        for lo, hi in zip(cuts, cuts[1:])
+    ]
+    selects.append((f"{select_sql} WHERE id >= %s ORDER BY id", (cuts[-1],)))
+    return selects
+
+
+def _tune_load_transaction(cur):
+    """Apply LOAD_SETTINGS to the current transaction only, in a single round trip."""
+    calls = ", ".join(["set_config(%s, %s, true)"] * len(LOAD_SETTINGS))
+    params = [item for setting in LOAD_SETTINGS.items() for item in setting]
+    cur.execute(f"SELECT {calls}", params)
+
+
+def _create_stage_table(cur, table: str) -> str:
+    """Create an UNLOGGED copy of ``table`` to stream rows into without writing WAL."""
+    stage = f"{table}_stage"
+    cur.execute(f"CREATE UNLOGGED TABLE {stage} (LIKE {table} INCLUDING DEFAULTS)")
+    return stage
+
+
+def _begin_bulk_load(cur, table: str) -> list[str]:
+    """Drop secondary indexes and disable triggers for a bulk load, returning the index defs."""
+    # Only indexes that don't back a constraint are dropped; _end_bulk_load rebuilds them
+    cur.execute(
+        """
+        SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+        FROM pg_index
+        WHERE indrelid = %(table)s::regclass
+          AND indexrelid NOT IN (
+              SELECT conindid FROM pg_constraint WHERE conrelid = %(table)s::regclass
+          )
+        """,
+        {"table": table},
+    )
+    index_defs = []
+    for index_name, index_def in cur.fetchall():
+        cur.execute(f"DROP INDEX {index_name}")
+        index_defs.append(index_def)
+    if index_defs:
+        logger.info(f"  Dropped {len(index_defs)} secondary index(es) on {table}")
+
+    # Keeps FK and user triggers from firing per row. Needs elevated privileges, so
+    # without them the load proceeds with triggers on; SET LOCAL ends with the transaction
+    cur.execute("SAVEPOINT bulk_load_triggers")
+    try:
+        cur.execute("SET LOCAL session_replication_role = replica")
+        cur.execute("RELEASE SAVEPOINT bulk_load_triggers")
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT bulk_load_triggers")
+        logger.warning(f"  Could not disable triggers on {table}, loading with them on: {e}")
+
+    return index_defs
+
+
+def _end_bulk_load(cur, table: str, index_defs: list[str]):
+    """Rebuild indexes dropped by _begin_bulk_load."""
+    for index_def in index_defs:
+        cur.execute(index_def)
+    if index_defs:
+        logger.info(f"  Rebuilt {len(index_defs)} secondary index(es) on {table}")
+
+
+def _reset_sequence(cur, table: str, columns: tuple[str, ...]):
+    """Reset the SERIAL sequence for a table after rows were loaded with explicit ids."""
+    if "id" in columns and table != "daily_meal_scores":
+        cur.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) "
+            f"FROM {table}"
+        )
+        logger.info(f"  Reset sequence for {table}")
+
+
+def _column_types(cur, table: str, columns: tuple[str, ...]) -> list[tuple[int, str]]:
+    """Look up the type OID and SQL type name of ``columns`` in ``table``."""
+    cur.execute(
+        """
+        SELECT attname, atttypid, format_type(atttypid, atttypmod) FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+        """,
+        (table,),
+    )
+    types = {name: (oid, type_name) for name, oid, type_name in cur.fetchall()}
+    return [types[column] for column in columns]
+
+
+def _swap_in_stage_table(
+    raw, cur, table: str, stage: str, columns: tuple[str, ...], drop_stage: bool = True
+) -> int:
+    """Replace the contents of ``table`` with the staged rows, commit and return the count."""
+    # Swapping in at the end of the load transaction keeps the live table locked only
+    # briefly and untouched if the load fails. CASCADE also empties referencing tables
+    # (people -> interactions), which TABLE_DEPENDENCIES loads afterwards.
+    columns_str = ", ".join(columns)
+    cur.execute(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE")
+    logger.info(f"  Cleared {table} in destination")
+    index_defs = _begin_bulk_load(cur, table)
+    cur.execute(f"INSERT INTO {table} ({columns_str}) SELECT {columns_str} FROM {stage}")
+    inserted = cur.rowcount
+    # Index rebuild, sequence reset and stage cleanup go out in one pipeline flush
+    with raw.dbapi_connection.pipeline():
+        _end_bulk_load(cur, table, index_defs)
+        _reset_sequence(cur, table, columns)
+        if drop_stage:
+            cur.execute(f"DROP TABLE {stage}")
+    raw.commit()
+    return inserted
+
+
+def migrate_table(
+    source_engine,
+    dest_engine,
+    table: str,
+    batch_size: int = 1000,
+    use_copy: bool = True,
+    expected_rows: int | None = None,
+) -> int:
+    """Migrate a single table from source to destination, returning the rows copied."""
+    total = expected_rows if expected_rows is not None else "?"
+    logger.info(f"Migrating {table}: ~{total} rows in source")
 
     # Get columns from source
     columns = get_table_columns(source_engine, table)
     columns_str = ", ".join(columns)
-    placeholders = ", ".join([f":{col}" for col in columns])
 
-    # Clear destination table before migration
-    with dest_engine.begin() as conn:
-        conn.execute(text(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE"))
-    logger.info(f"  Cleared {table} in destination")
+    # A background reader streams rows from the source while this thread loads them
+    # into an unlogged stage table, so memory stays bounded by the read-ahead
+    inserted = 0
+    last_log = time.monotonic()
 
-    # Read all data from source
-    with source_engine.connect() as source_conn:
-        result = source_conn.execute(text(f"SELECT {columns_str} FROM {table}"))
-        rows = result.fetchall()
+    def log_progress():
+        nonlocal last_log
+        if time.monotonic() - last_log >= PROGRESS_LOG_INTERVAL:
+            logger.info(f"  {table}: loaded {inserted}/~{total} rows")
+            last_log = time.monotonic()
 
-    # Insert into destination in batches
-    inserted = 0
-    with dest_engine.begin() as dest_conn:
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
-            for row in batch:
-                # Convert row to dict for parameterized insert
-                row_dict = dict(zip(columns, row))
-                dest_conn.execute(
-                    text(f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"),
-                    row_dict,
+    raw = dest_engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        _tune_load_transaction(cur)
+        stage = _create_stage_table(cur, table)
+        placeholders = ", ".join(["%s"] * len(columns))
+        insert_sql = f"INSERT INTO {stage} ({columns_str}) VALUES ({placeholders})"
+        selects = _source_selects(source_engine, table, columns, batch_size)
+        with closing(_read_ahead(source_engine, selects, batch_size)) as batches:
+            if use_copy:
+                # Binary COPY dumps each value by the destination type alone, so it is
+                # only used when the source column types match exactly
+                dest_types = _column_types(cur, stage, columns)
+                with closing(source_engine.raw_connection()) as src:
+                    source_types = _column_types(src.cursor(), table, columns)
+                binary = [name for _, name in source_types] == [name for _, name in dest_types]
+                if not binary:
+                    logger.warning(f"  Column types of {table} differ, loading with text COPY")
+                copy_format = "BINARY" if binary else "TEXT"
+                copy_sql = f"COPY {stage} ({columns_str}) FROM STDIN WITH (FORMAT {copy_format})"
+                with cur.copy(copy_sql) as copy:
+                    if binary:
+                        copy.set_types([oid for oid, _ in dest_types])
+                    for batch in batches:
+                        for row in batch:
+                            copy.write_row(row)
+                        inserted += len(batch)
+                        log_progress()
+            else:
+                for batch in batches:
+                    cur.executemany(insert_sql, batch)
+                    inserted += len(batch)
+                    log_progress()
+        if inserted == 0:
+            logger.info(f"  Skipping {table}: no rows to migrate")
+            raw.rollback()
+            return 0
+        _swap_in_stage_table(raw, cur, table, stage, columns)
+        cur.close()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    logger.info(f"  Completed {table}: {inserted} rows migrated")
+    return inserted
+
+
+def migrate_table_binary(
+    source_engine, dest_engine, table: str, expected_rows: int | None = None
+) -> int:
+    """Migrate a single table by piping binary COPY output from source straight into dest."""
+    # Binary format requires identical column types on both sides, which holds for the
+    # schema created by ensure_schema_exists
+    total = expected_rows if expected_rows is not None else "?"
+    logger.info(f"Migrating {table} (binary COPY): ~{total} rows in source")
+
+    columns = get_table_columns(source_engine, table)
+    columns_str = ", ".join(columns)
+
+    pipe = _CopyPipe()
+
+    def produce():
+        try:
+            src = source_engine.raw_connection()
+            try:
+                src_cur = src.cursor()
+                src_cur.execute(
+                    f"COPY {table} ({columns_str}) TO STDOUT WITH (FORMAT BINARY)",
+                    stream=pipe,
                 )
-            inserted += len(batch)
-            logger.info(f"  Inserted {inserted}/{len(rows)} rows")
+                src_cur.close()
+            finally:
+                src.close()
+            pipe.close()
+        except Exception as e:
+            pipe.close(e)
+
+    producer = threading.Thread(target=produce, name=f"copy-out-{table}", daemon=True)
+    dst = dest_engine.raw_connection()
+    try:
+        producer.start()
+        dst_cur = dst.cursor()
+        _tune_load_transaction(dst_cur)
+        stage = _create_stage_table(dst_cur, table)
+        with dst_cur.copy(
+            f"COPY {stage} ({columns_str}) FROM STDIN WITH (FORMAT BINARY)"
+        ) as copy:
+            while data := pipe.read():
+                copy.write(data)
+        copied = dst_cur.rowcount
+        if copied == 0:
+            logger.info(f"  Skipping {table}: no rows to migrate")
+            dst.rollback()
+            return 0
+        _swap_in_stage_table(dst, dst_cur, table, stage, columns)
+        dst_cur.close()
+    except Exception:
+        pipe.abort()
+        dst.rollback()
+        raise
+    finally:
+        producer.join()
+        dst.close()
+
+    logger.info(f"  Completed {table}: {copied} rows migrated")
+    return copied
+
+
+def get_fdw_password() -> str:
+    """Get FDW_SOURCE_PASSWORD, or else a short-lived IAM access token for DB_USER."""
+    password = os.environ.get("FDW_SOURCE_PASSWORD")
+    if password:
+        return password
+
+    import google.auth
+    from google.auth.transport.requests import Request
+
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/sqlservice.login"]
+    )
+    credentials.refresh(Request())
+    return credentials.token
+
+
+def _drop_fdw_objects(cur):
+    """Drop the FDW_SERVER server and FDW_SCHEMA schema if they were created by setup_fdw."""
+    cur.execute(
+        """
+        SELECT 'server', obj_description(oid, 'pg_foreign_server')
+        FROM pg_foreign_server WHERE srvname = %s
+        UNION ALL
+        SELECT 'schema', obj_description(oid, 'pg_namespace')
+        FROM pg_namespace WHERE nspname = %s
+        """,
+        (FDW_SERVER, FDW_SCHEMA),
+    )
+    existing = cur.fetchall()
+    for kind, comment in existing:
+        if comment != FDW_COMMENT:
+            raise RuntimeError(
+                f"A {kind} named {FDW_SERVER if kind == 'server' else FDW_SCHEMA} already "
+                "exists in the destination and was not created by this script; "
+                "rename or drop it before using --method fdw"
+            )
+    if existing:
+        cur.execute(f"DROP SCHEMA IF EXISTS {FDW_SCHEMA} CASCADE")
+        cur.execute(f"DROP SERVER IF EXISTS {FDW_SERVER} CASCADE")
 
-    # Reset sequence for tables with SERIAL id
-    if "id" in columns and table != "daily_meal_scores":
+
+def setup_fdw(dest_engine, tables: list[str], password: str) -> bool:
+    """Expose the source tables in the destination's FDW_SCHEMA through postgres_fdw."""
+    # Returns False if postgres_fdw is not available in the destination
+    import psycopg
+    from psycopg import sql
+    from sqlalchemy import text
+
+    try:
         with dest_engine.begin() as conn:
-            conn.execute(
-                text(
-                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
-                )
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgres_fdw"))
+    except Exception as e:
+        logger.warning(f"  postgres_fdw is not available in destination: {e}")
+        return False
+
+    server_options = {
+        "host": os.environ["FDW_SOURCE_HOST"],
+        "port": os.environ.get("FDW_SOURCE_PORT", "5432"),
+        "dbname": os.environ["DB_NAME"],
+        "sslmode": "require",
+    }
+    user_options = {"user": os.environ["DB_USER"], "password": password}
+
+    def options(values: dict) -> sql.Composed:
+        # DDL options can't take bind parameters, so values are quoted client-side
+        return sql.SQL(", ").join(
+            sql.SQL("{} {}").format(sql.SQL(key), sql.Literal(value))
+            for key, value in values.items()
+        )
+
+    raw = dest_engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        # Leftovers of an interrupted run are replaced; anything else is never touched
+        _drop_fdw_objects(cur)
+        cur.execute(
+            sql.SQL(
+                f"CREATE SERVER {FDW_SERVER} FOREIGN DATA WRAPPER postgres_fdw OPTIONS ({{}})"
+            ).format(options(server_options))
+        )
+        cur.execute(
+            sql.SQL(f"COMMENT ON SERVER {FDW_SERVER} IS {{}}").format(sql.Literal(FDW_COMMENT))
+        )
+        try:
+            cur.execute(
+                sql.SQL(
+                    f"CREATE USER MAPPING FOR CURRENT_USER SERVER {FDW_SERVER} OPTIONS ({{}})"
+                ).format(options(user_options))
             )
-        logger.info(f"  Reset sequence for {table}")
+        except psycopg.Error as e:
+            # Re-raise without the original error so the credential can't reach the logs
+            raise RuntimeError(
+                f"Could not create user mapping for {FDW_SERVER} (SQLSTATE {e.sqlstate})"
+            ) from None
+        cur.execute(f"CREATE SCHEMA {FDW_SCHEMA}")
+        cur.execute(
+            sql.SQL(f"COMMENT ON SCHEMA {FDW_SCHEMA} IS {{}}").format(sql.Literal(FDW_COMMENT))
+        )
+        cur.execute(
+            f"IMPORT FOREIGN SCHEMA public LIMIT TO ({', '.join(tables)}) "
+            f"FROM SERVER {FDW_SERVER} INTO {FDW_SCHEMA}"
+        )
+        cur.close()
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
 
-    dest_count = get_table_count(dest_engine, table)
-    logger.info(f"  Completed {table}: {dest_count} rows in destination")
+    logger.info(f"  Imported source tables into {FDW_SCHEMA} via postgres_fdw")
+    return True
+
+
+def teardown_fdw(dest_engine):
+    """Remove the foreign server, user mapping and imported schema created by setup_fdw."""
+    raw = dest_engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        _drop_fdw_objects(cur)
+        cur.close()
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+
+def migrate_table_fdw(dest_engine, table: str, expected_rows: int | None = None) -> int:
+    """Migrate a single table server-to-server with INSERT ... SELECT from its foreign table."""
+    total = expected_rows if expected_rows is not None else "?"
+    logger.info(f"Migrating {table} (postgres_fdw): ~{total} rows in source")
+
+    foreign_table = f"{FDW_SCHEMA}.{table}"
+    columns = get_table_columns(dest_engine, foreign_table)
+
+    raw = dest_engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        _tune_load_transaction(cur)
+        cur.execute(f"SELECT EXISTS (SELECT 1 FROM {foreign_table})")
+        if not cur.fetchone()[0]:
+            logger.info(f"  Skipping {table}: no rows to migrate")
+            raw.rollback()
+            return 0
+        copied = _swap_in_stage_table(raw, cur, table, foreign_table, columns, drop_stage=False)
+        cur.close()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    logger.info(f"  Completed {table}: {copied} rows migrated")
+    return copied
+
+
+def migrate_tables(migrate_fn, tables: list[str], max_workers: int = 3) -> dict[str, int]:
+    """Migrate tables concurrently, starting each one once its dependencies have finished."""
+    # Workers are I/O bound, so threads suffice; each checks out its own connections
+    remaining = list(tables)
+    done: dict[str, int] = {}
+    running: dict[concurrent.futures.Future, str] = {}
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="migrate"
+    ) as executor:
+        while remaining or running:
+            for table in list(remaining):
+                if TABLE_DEPENDENCIES.get(table, set()) <= done.keys():
+                    running[executor.submit(migrate_fn, table)] = table
+                    remaining.remove(table)
+            if not running:
+                raise RuntimeError(f"Unresolvable table dependencies: {remaining}")
+
+            finished, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in finished:
+                table = running.pop(future)
+                try:
+                    done[table] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to migrate {table}: {e}")
+                    for pending in running:
+                        pending.cancel()
+                    raise
+    return done
 
 
 def main():
@@ -251,6 +819,17 @@ def main():
         action="store_true",
         help="Skip confirmation prompt"
     )
+    parser.add_argument(
+        "--method",
+        choices=["copy", "binary", "insert", "fdw"],
+        default="copy",
+        help=(
+            "How rows are loaded: COPY (default), binary COPY piped from source "
+            "(requires identical column types), batched multi-row INSERTs, or "
+            "server-to-server via postgres_fdw (requires FDW_SOURCE_HOST; falls back "
+            "to COPY if the extension is unavailable)"
+        )
+    )
     args = parser.parse_args()
 
     logger.info("=" * 60)
@@ -261,8 +840,10 @@ def main():
     required_gcp = ["INSTANCE_CONNECTION_NAME", "DB_NAME", "DB_USER"]
     required_neon = ["NEON_DATABASE_URL"]
 
+    required_fdw = ["FDW_SOURCE_HOST"] if args.method == "fdw" else []
+
     missing = []
-    for var in required_gcp + required_neon:
+    for var in required_gcp + required_neon + required_fdw:
         if not os.environ.get(var):
             missing.append(var)
 
@@ -275,9 +856,15 @@ def main():
         logger.error("    DB_USER - IAM user email")
         logger.error("  Neon (destination):")
         logger.error("    NEON_DATABASE_URL - postgres connection string")
+        if required_fdw:
+            logger.error("  --method fdw:")
+            logger.error("    FDW_SOURCE_HOST - source instance public IP")
         sys.exit(1)
 
     try:
+        # Resolve the FDW credential up front so a failure can't follow the confirmation
+        fdw_password = get_fdw_password() if args.method == "fdw" else None
+
         # Connect to both databases
         logger.info("\nConnecting to databases...")
         source_engine = get_gcp_engine()
@@ -298,13 +885,18 @@ def main():
         logger.info("\nEnsuring schema exists in destination...")
         ensure_schema_exists(dest_engine, TABLES_TO_MIGRATE)
 
-        # Show current state
-        logger.info("\nCurrent state before migration:")
+        # Show current state (planner estimates; exact counts would scan every table)
+        logger.info("\nCurrent state before migration (estimated):")
+        estimates: dict[str, int | None] = {}
         for table in TABLES_TO_MIGRATE:
             try:
-                source_count = get_table_count(source_engine, table)
-                dest_count = get_table_count(dest_engine, table)
-                logger.info(f"  {table}: {source_count} (source) → {dest_count} (dest)")
+                source_estimate = get_estimated_count(source_engine, table)
+                dest_estimate = get_estimated_count(dest_engine, table)
+                estimates[table] = source_estimate
+                logger.info(
+                    f"  {table}: ~{'?' if source_estimate is None else source_estimate} (source)"
+                    f" → ~{'?' if dest_estimate is None else dest_estimate} (dest)"
+                )
             except Exception as e:
                 logger.warning(f"  {table}: error checking counts - {e}")
 
@@ -324,20 +916,46 @@ def main():
 
         # Migrate each table
         logger.info("\nStarting table migration...")
-        for table in TABLES_TO_MIGRATE:
-            try:
-                migrate_table(source_engine, dest_engine, table)
-            except Exception as e:
-                logger.error(f"Failed to migrate {table}: {e}")
-                raise
+        method = args.method
+        if method == "fdw" and not setup_fdw(dest_engine, TABLES_TO_MIGRATE, fdw_password):
+            logger.warning("  Falling back to COPY")
+            method = "copy"
+
+        def migrate_fn(table: str) -> int:
+            if method == "fdw":
+                return migrate_table_fdw(dest_engine, table, expected_rows=estimates.get(table))
+            if method == "binary":
+                return migrate_table_binary(
+                    source_engine, dest_engine, table, expected_rows=estimates.get(table)
+                )
+            return migrate_table(
+                source_engine,
+                dest_engine,
+                table,
+                use_copy=method == "copy",
+                expected_rows=estimates.get(table),
+            )
 
-        # Show final state
+        try:
+            migrated = migrate_tables(migrate_fn, TABLES_TO_MIGRATE)
+        finally:
+            if method == "fdw":
+                try:
+                    teardown_fdw(dest_engine)
+                except Exception as e:
+                    # Don't mask a migration error with a cleanup one
+                    logger.warning(f"  Could not remove {FDW_SCHEMA} postgres_fdw objects: {e}")
+
+        # Show final state (the source estimate is for reference only)
         logger.info("\nFinal state after migration:")
         for table in TABLES_TO_MIGRATE:
-            source_count = get_table_count(source_engine, table)
             dest_count = get_table_count(dest_engine, table)
-            status = "✓" if source_count == dest_count else "⚠"
-            logger.info(f"  {status} {table}: {source_count} (source) = {dest_count} (dest)")
+            estimate = estimates.get(table)
+            status = "✓" if migrated[table] == dest_count else "⚠"
+            logger.info(
+                f"  {status} {table}: {migrated[table]} (copied) = {dest_count} (dest),"
+                f" ~{'?' if estimate is None else estimate} (source estimate)"
+            )
 
         logger.info("\n" + "=" * 60)
         logger.info("Migration completed successfully!")